@@ -1,5 +1,90 @@
+import array
+import functools
+import operator
 import sqlite3
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; memory falls back to array.array
+    np = None
+
+# PUSH1..PUSH32 opcodes; PUSHn is followed by n immediate bytes
+_PUSH_OPS = range(0x60, 0x80)
+
+# Mnemonics of the implemented opcodes; each is handled by the EVM method ``_op_<mnemonic>``.
+# All PUSHn variants share one handler.
+_OPCODES = {0x01: 'add', 0x02: 'sub', 0x03: 'mul', 0x51: 'mload', 0x52: 'mstore'}
+_OPCODES.update((op, 'push') for op in _PUSH_OPS)
+
+# Number of immediate bytes following opcodes that take an inline operand
+_IMMEDIATE_BYTES = {op: op - 0x5f for op in _PUSH_OPS}
+
+# Stack effect of each implemented opcode as (items required, net depth change)
+_STACK_EFFECT = {
+    0x01: (2, -1), 0x02: (2, -1), 0x03: (2, -1),
+    0x51: (1, 0), 0x52: (2, -2),
+}
+_STACK_EFFECT.update((op, (0, 1)) for op in _PUSH_OPS)
+
+# Binary opcodes folded at decode time when both operands are PUSH constants
+_FOLDABLE = {0x01: operator.add, 0x02: operator.sub, 0x03: operator.mul}
+
+# Number of bytecodes whose decoded plans and compiled functions are cached
+_CACHE_SIZE = 4096
+
+# Stack-safe runs of the same bytecode after which it is compiled to Python; compiling
+# costs far more than one interpreted run, so only code that repeats is worth it
+_COMPILE_THRESHOLD = 8
+
+# Inline Python emitted by EVM._compile for unchecked handlers, keyed by handler name.
+# ``s`` is the stack, ``sp`` the local stack pointer and ``{arg}`` the immediate. Each
+# entry must behave like the method of the same name; EVM._check_source verifies this.
+_SOURCE = {
+    '_op_push_unchecked': ("s[sp] = {arg}", "sp += 1"),
+    '_op_add_unchecked': ("sp -= 1", "s[sp - 1] += s[sp]"),
+    '_op_sub_unchecked': ("sp -= 1", "s[sp - 1] -= s[sp]"),
+    '_op_mul_unchecked': ("sp -= 1", "s[sp - 1] *= s[sp]"),
+    '_op_mstore_unchecked': ("sp -= 2", "evm.mstore(s[sp], s[sp + 1])"),
+    '_op_mload_unchecked': ("m = evm.memory", "a = s[sp - 1]", "s[sp - 1] = int(m[a]) if a < len(m) else 0"),
+}
+
+# Storage statements, each run on its own long-lived cursor
+_SQL_INSERT = "INSERT OR IGNORE INTO storage (key, value) VALUES (?, ?)"
+_SQL_UPDATE = "UPDATE storage SET value = ? WHERE key = ?"
+_SQL_LOAD = "SELECT value FROM storage WHERE key = ?"
+
+# Open databases shared by all EVM instances, keyed by path. Each entry holds the
+# connection and the storage row count, so both are shared between instances.
+_POOL = {}
+
+def _immediate(code, pc, size):
+    """
+    Reads the big-endian immediate that follows the opcode at a given position.
+
+    Bytes past the end of the code read as zero, as in the EVM.
+
+    :param code: The bytecode as raw bytes.
+    :param pc: The position of the opcode.
+    :param size: The number of immediate bytes.
+    :return: The immediate as an int.
+    """
+    return int.from_bytes(code[pc + 1:pc + 1 + size].ljust(size, b'\0'), 'big')
+
+# Range of values a memory word can hold (signed 64-bit)
+_WORD_MIN = -2 ** 63
+_WORD_MAX = 2 ** 63 - 1
+
+def _zeros(size):
+    """
+    Allocates zero-filled int64 memory words.
+
+    :param size: The number of words.
+    :return: A NumPy array, or an ``array.array('q')`` when NumPy is not installed.
+    """
+    if np is not None:
+        return np.zeros(size, np.int64)
+    return array.array('q', bytes(8 * size))
+
 class EVM:
     """
     A simplified Python-based simulation of the Ethereum Virtual Machine (EVM).
@@ -12,30 +97,53 @@ class EVM:
         
         :param db_path: Path to the SQLite database file.
         """
-        self.memory = [0] * 1024  # Simulated fixed-size memory
-        self.stack = []  # Operation stack
-        self.conn = sqlite3.connect(db_path)  # Database connection
+        self.memory = _zeros(1024)  # Simulated int64 memory, grown on demand
+        self.stack = [0] * 1024  # Operation stack, preallocated to the maximum depth
+        self.sp = 0  # Stack pointer: number of live entries in self.stack
+        db = _POOL.get(db_path)
+        if db is None:
+            db = {'conn': sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)}
+        self._db = db
+        self._db_path = db_path
+        self.conn = db['conn']  # Database connection, in autocommit mode
         self.cursor = self.conn.cursor()
-        self._setup_db()
+        self._store_cursor = self.conn.cursor()
+        self._load_cursor = self.conn.cursor()
+        if 'storage_count' not in db:
+            self._setup_db()
+            if db_path != ':memory:':  # Every in-memory connection is its own database
+                _POOL[db_path] = db
 
     def _setup_db(self):
-        """Sets up the storage table in the database."""
+        """
+        Tunes a newly opened SQLite connection and sets up the storage table in the database.
+
+        Runs once per pooled connection rather than once per instance.
+        """
+        self.cursor.execute("PRAGMA journal_mode=WAL")
+        self.cursor.execute("PRAGMA synchronous=NORMAL")
+        self.cursor.execute("PRAGMA temp_store=MEMORY")
+        self.cursor.execute("PRAGMA cache_size=-20000")
+        self.cursor.execute("PRAGMA busy_timeout=5000")
         self.cursor.execute("CREATE TABLE IF NOT EXISTS storage (key TEXT PRIMARY KEY, value INTEGER)")
-        self.conn.commit()
+        self.cursor.execute("SELECT COUNT(*) FROM storage")
+        self._db['storage_count'] = self.cursor.fetchone()[0]  # Kept up to date by store/store_many
 
     def print_state(self):
         """Prints the current state of the EVM, including stack, memory, and storage."""
         print("=== EVM State ===")
-        print("Stack (top -> bottom):", list(reversed(self.stack)))
+        sp = self.sp
+        print("Stack (top -> bottom):", self.stack[sp - 1::-1] if sp else [])
         
-        self.cursor.execute("SELECT COUNT(*) FROM storage")
-        storage_count = self.cursor.fetchone()[0]
-        print("Persistent Storage Usage:", storage_count, "items")
+        print("Persistent Storage Usage:", self._db['storage_count'], "items")
         
-        memory_usage = sum(1 for x in self.memory if x != 0)
+        if np is not None:
+            memory_usage = int(np.count_nonzero(self.memory))
+        else:
+            memory_usage = len(self.memory) - self.memory.count(0)
         print("Memory Usage:", memory_usage, "/ 1024 words")
         
-        print("Stack Depth:", len(self.stack), "/ 1024")
+        print("Stack Depth:", self.sp, "/ 1024")
         print("=================")
 
     def push(self, value):
@@ -44,10 +152,11 @@ class EVM:
 
         :param value: The value to push.
         """
-        if len(self.stack) < 1024:
-            self.stack.append(value)
-        else:
-            raise Exception("Stack overflow")
+        try:
+            self.stack[self.sp] = value
+        except IndexError:
+            raise Exception("Stack overflow") from None
+        self.sp += 1
 
     def pop(self):
         """
@@ -55,20 +164,44 @@ class EVM:
 
         :return: The value at the top of the stack.
         """
-        if self.stack:
-            return self.stack.pop()
-        else:
+        sp = self.sp - 1
+        if sp < 0:
             raise Exception("Stack underflow")
+        self.sp = sp
+        return self.stack[sp]
 
     def store(self, key, value):
         """
         Stores a value in the SQLite database using a specified key.
 
+        The write is committed on its own; use ``store_many`` to group writes
+        into a single transaction.
+
         :param key: The key for the value.
         :param value: The value to store.
         """
-        self.cursor.execute("INSERT OR REPLACE INTO storage (key, value) VALUES (?, ?)", (key, value))
-        self.conn.commit()
+        cursor = self._store_cursor
+        cursor.execute(_SQL_INSERT, (key, value))
+        if cursor.rowcount:
+            self._db['storage_count'] += 1
+        else:
+            cursor.execute(_SQL_UPDATE, (value, key))
+
+    def store_many(self, items):
+        """
+        Stores several key/value pairs in the SQLite database in a single transaction.
+
+        :param items: An iterable of ``(key, value)`` pairs.
+        """
+        items = list(items)
+        cursor = self._store_cursor
+        with self.conn:
+            cursor.execute("BEGIN")
+            cursor.executemany(_SQL_INSERT, items)
+            inserted = cursor.rowcount
+            if inserted < len(items):
+                cursor.executemany(_SQL_UPDATE, [(value, key) for key, value in items])
+        self._db['storage_count'] += inserted
 
     def load(self, key):
         """
@@ -77,41 +210,76 @@ class EVM:
         :param key: The key of the value to load.
         :return: The value associated with the key, or 0 if not found.
         """
-        self.cursor.execute("SELECT value FROM storage WHERE key=?", (key,))
-        result = self.cursor.fetchone()
-        return result[0] if result else 0
+        return next(self._load_cursor.execute(_SQL_LOAD, (key,)), (0,))[0]
 
     def add(self):
         """Adds the top two values on the stack."""
-        if len(self.stack) >= 2:
-            self.push(self.pop() + self.pop())
-        else:
+        s, sp = self.stack, self.sp
+        if sp < 2:
             raise Exception("Stack underflow for ADD")
+        s[sp - 2] += s[sp - 1]
+        self.sp = sp - 1
 
     def sub(self):
         """Subtracts the top two values on the stack."""
-        if len(self.stack) >= 2:
-            a, b = self.pop(), self.pop()
-            self.push(b - a)
-        else:
+        s, sp = self.stack, self.sp
+        if sp < 2:
             raise Exception("Stack underflow for SUB")
+        s[sp - 2] -= s[sp - 1]
+        self.sp = sp - 1
 
     def mul(self):
         """Multiplies the top two values on the stack."""
-        if len(self.stack) >= 2:
-            self.push(self.pop() * self.pop())
-        else:
+        s, sp = self.stack, self.sp
+        if sp < 2:
             raise Exception("Stack underflow for MUL")
+        s[sp - 2] *= s[sp - 1]
+        self.sp = sp - 1
+
+    # Opcode handlers that are plain stack operations
+    _op_push = push
+    _op_add = add
+    _op_sub = sub
+    _op_mul = mul
+
+    # Unchecked variants, only run once decoding has proven the stack stays in bounds
+    def _op_push_unchecked(self, value):
+        """Pushes a value without an overflow check."""
+        self.stack[self.sp] = value
+        self.sp += 1
+
+    def _op_add_unchecked(self):
+        """Adds the top two values on the stack without an underflow check."""
+        s, sp = self.stack, self.sp - 1
+        s[sp - 1] += s[sp]
+        self.sp = sp
+
+    def _op_sub_unchecked(self):
+        """Subtracts the top two values on the stack without an underflow check."""
+        s, sp = self.stack, self.sp - 1
+        s[sp - 1] -= s[sp]
+        self.sp = sp
+
+    def _op_mul_unchecked(self):
+        """Multiplies the top two values on the stack without an underflow check."""
+        s, sp = self.stack, self.sp - 1
+        s[sp - 1] *= s[sp]
+        self.sp = sp
 
     def mstore(self, address, value):
         """
         Stores a value in memory at a specific address.
 
+        Memory words are signed 64-bit integers, so values outside that range
+        are rejected even though the stack holds arbitrary Python ints.
+
         :param address: The memory address.
         :param value: The value to store in memory.
         """
+        if not _WORD_MIN <= value <= _WORD_MAX:
+            raise Exception("Memory value out of 64-bit range")
         if address >= len(self.memory):
-            self.memory += [0] * (address + 1 - len(self.memory))
+            self._grow_memory(address)
         self.memory[address] = value
 
     def mload(self, address):
@@ -120,44 +288,321 @@ class EVM:
 
         :param address: The memory address to load the value from.
         """
-        if address < len(self.memory):
-            self.push(self.memory[address])
+        self.push(int(self.memory[address]) if address < len(self.memory) else 0)
+
+    def _grow_memory(self, address):
+        """
+        Grows memory geometrically so that it covers a given address.
+
+        :param address: The memory address that must become valid.
+        """
+        size = len(self.memory)
+        new_size = max(size * 2, address + 1)
+        if np is not None:
+            self.memory = np.resize(self.memory, new_size)
+            self.memory[size:] = 0
         else:
-            self.push(0)
+            self.memory.frombytes(bytes(8 * (new_size - size)))
+
+    def _op_mstore(self):
+        """Pops a value and an address from the stack and stores the value in memory (MSTORE)."""
+        value = self.pop()
+        address = self.pop()
+        self.mstore(address, value)
+
+    def _op_mload(self):
+        """Pops an address from the stack and pushes the value stored there (MLOAD)."""
+        self.mload(self.pop())
+
+    def _op_mstore_unchecked(self):
+        """MSTORE without underflow checks."""
+        s, sp = self.stack, self.sp - 2
+        self.sp = sp
+        self.mstore(s[sp], s[sp + 1])
+
+    def _op_mload_unchecked(self):
+        """MLOAD without underflow checks; the loaded value replaces the address in place."""
+        s, top = self.stack, self.sp - 1
+        address = s[top]
+        s[top] = int(self.memory[address]) if address < len(self.memory) else 0
+
+    def _check_fused_pushes(self):
+        """Raises the overflow the two PUSHes replaced by a fused instruction would hit."""
+        if self.sp + 2 > len(self.stack):
+            raise Exception("Stack overflow")
+
+    def _op_push_const(self, value):
+        """Pushes the precomputed result of a fused PUSH, PUSH, ADD|SUB|MUL."""
+        self._check_fused_pushes()
+        self.push(value)
+
+    def _op_mstore_const(self, arg):
+        """Stores a constant value at a constant address (fused PUSH, PUSH, MSTORE)."""
+        self._check_fused_pushes()
+        self._op_mstore_const_unchecked(arg)
+
+    def _op_mstore_const_unchecked(self, arg):
+        """Fused PUSH, PUSH, MSTORE without the stack overflow check."""
+        address, value = arg
+        self.mstore(address, value)
+
+    def _op_invalid(self, op):
+        """Reports an opcode the simulation does not support."""
+        print(f"Unknown opcode: {op:02x}")
+
+    @classmethod
+    def _build_dispatch(cls):
+        """
+        Builds the class-wide 256-entry opcode tables indexed directly by opcode byte.
+
+        ``_dispatch[op]`` is the ``_op_*`` handler function for ``op``, or
+        ``_op_invalid`` if it is not implemented, and ``_dispatch_unchecked[op]``
+        its ``_op_*_unchecked`` variant where one exists. ``_operand_len[op]`` is
+        the number of immediate bytes that follow ``op`` in the code.
+        """
+        cls._dispatch = tuple(
+            getattr(cls, f"_op_{_OPCODES[op]}") if op in _OPCODES else cls._op_invalid
+            for op in range(256)
+        )
+        cls._dispatch_unchecked = tuple(
+            getattr(cls, f"_op_{_OPCODES[op]}_unchecked", handler) if op in _OPCODES else handler
+            for op, handler in enumerate(cls._dispatch)
+        )
+        cls._operand_len = tuple(_IMMEDIATE_BYTES.get(op, 0) for op in range(256))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=_CACHE_SIZE)
+    def _decode(code):
+        """
+        Decodes bytecode into a flat execution plan in a single linear scan.
+
+        Immediates are read straight from the code bytes, so execution never
+        parses hex or compares opcodes. ``PUSHn x, PUSHm y, ADD|SUB|MUL`` is
+        folded into a single push of the result and ``PUSHn a, PUSHm v, MSTORE``
+        into a direct memory write. Decoding stops at the first unknown opcode,
+        whose handler reports it as the last step of the plan.
+
+        The same pass tracks the stack depth relative to the start of execution,
+        recording the lowest depth any instruction needs and the highest depth
+        reached, so ``execute`` can check stack bounds once up front. Fused
+        instructions count the peak of the PUSHes they replace.
+
+        Plans hold unbound handler functions, so they are cached once for the
+        whole class and shared by every EVM instance.
+
+        :param code: The bytecode as raw bytes.
+        :return: A ``(handlers, unchecked, imms, low, high)`` tuple;
+                 ``imms[i]`` is the argument for ``handlers[i]`` and
+                 ``unchecked[i]``, or None if the handler takes no argument,
+                 and ``low``/``high`` are the depth bounds.
+        """
+        dispatch = EVM._dispatch
+        dispatch_unchecked = EVM._dispatch_unchecked
+        operand_len = EVM._operand_len
+        invalid = EVM._op_invalid
+        handlers = []
+        unchecked = []
+        imms = []
+        depth = low = high = 0
+        pc = 0
+        n = len(code)
+        while pc < n:
+            op = code[pc]
+            size = operand_len[op]
+            second = pc + 1 + size
+            if size and second < n and operand_len[code[second]]:  # Two consecutive PUSHes
+                third = second + 1 + operand_len[code[second]]
+                fused = code[third] if third < n else None
+                if fused in _FOLDABLE or fused == 0x52:
+                    high = max(high, depth + 2)  # Both PUSHes are live before the fused op
+                if fused in _FOLDABLE:
+                    handlers.append(EVM._op_push_const)
+                    unchecked.append(EVM._op_push_unchecked)
+                    imms.append(_FOLDABLE[fused](
+                        _immediate(code, pc, size),
+                        _immediate(code, second, operand_len[code[second]]),
+                    ))
+                    depth += 1
+                    pc = third + 1
+                    continue
+                if fused == 0x52:
+                    handlers.append(EVM._op_mstore_const)
+                    unchecked.append(EVM._op_mstore_const_unchecked)
+                    imms.append((
+                        _immediate(code, pc, size),
+                        _immediate(code, second, operand_len[code[second]]),
+                    ))
+                    pc = third + 1
+                    continue
+            handler = dispatch[op]
+            handlers.append(handler)
+            unchecked.append(dispatch_unchecked[op])
+            if handler is invalid:
+                imms.append(op)
+                break
+            imms.append(_immediate(code, pc, size) if size else None)
+            required, delta = _STACK_EFFECT[op]
+            low = min(low, depth - required)
+            depth += delta
+            high = max(high, depth)
+            pc = second
+
+        return tuple(handlers), tuple(unchecked), tuple(imms), low, high
+
+    # Stack-safe run counts per bytecode, used to pick code hot enough to compile
+    _run_counts = {}
+
+    @staticmethod
+    @functools.lru_cache(maxsize=_CACHE_SIZE)
+    def _compile(code):
+        """
+        Compiles bytecode into a straight-line Python function.
+
+        The unchecked handlers of the decoded plan are expanded inline from
+        ``_SOURCE``, so the generated function has no dispatch and works on a
+        local stack pointer. Handlers without an inline form are called as
+        methods. The function must only run when the plan's stack bounds hold.
+
+        :param code: The bytecode as raw bytes.
+        :return: A function taking the EVM instance to run the code on.
+        """
+        _, unchecked, imms, _, _ = EVM._decode(code)
+        body = []
+        for handler, arg in zip(unchecked, imms):
+            lines = _SOURCE.get(handler.__name__)
+            if lines is None:
+                call_arg = '' if arg is None else repr(arg)
+                lines = ("evm.sp = sp", f"evm.{handler.__name__}({call_arg})", "sp = evm.sp")
+            body.extend(line.format(arg=repr(arg)) for line in lines)
+
+        src = "def run(evm):\n    s = evm.stack\n    sp = evm.sp\n    try:\n"
+        src += "".join(f"        {line}\n" for line in body or ["pass"])
+        src += "    finally:\n        evm.sp = sp\n"
+        namespace = {}
+        exec(compile(src, "<evm>", "exec"), namespace)
+        return namespace['run']
+
+    @classmethod
+    def _check_source(cls):
+        """
+        Checks that every ``_SOURCE`` entry behaves like its unchecked method.
+
+        Each opcode whose unchecked handler has inline source is run once through
+        the handler and once through ``_compile`` on the same starting state, and
+        the resulting stacks and memory must match.
+        """
+        covered = set()
+        for op in _OPCODES:
+            name = cls._dispatch_unchecked[op].__name__
+            if name not in _SOURCE or name in covered:
+                continue
+            covered.add(name)
+            code = bytes([op]) + bytes([7] * _IMMEDIATE_BYTES.get(op, 0))
+            states = []
+            for compiled in (False, True):
+                evm = object.__new__(cls)
+                evm.stack, evm.sp, evm.memory = [3, 5] + [0] * 6, 2, _zeros(8)
+                evm.memory[5] = 11
+                if compiled:
+                    cls._compile(code)(evm)
+                else:
+                    _, unchecked, imms, _, _ = cls._decode(code)
+                    for handler, arg in zip(unchecked, imms):
+                        if arg is None:
+                            handler(evm)
+                        else:
+                            handler(evm, arg)
+                states.append((evm.stack, evm.sp, list(evm.memory)))
+            if states[0] != states[1]:
+                raise Exception(f"Inline source of {name} does not match the method")
+        if covered != set(_SOURCE):
+            raise Exception(f"Inline source without a handler: {sorted(set(_SOURCE) - covered)}")
 
     def execute(self, bytecode):
         """
         Executes a given sequence of bytecode instructions.
 
+        When the current stack depth keeps every instruction within bounds, the
+        unchecked handlers run with no per-instruction stack checks, and once the
+        same bytecode has run that way ``_COMPILE_THRESHOLD`` times it runs as a
+        compiled straight-line function instead. Otherwise the checked handlers
+        run one by one.
+
         :param bytecode: The bytecode instructions to execute.
         """
-        pc = 0  # Program counter
-        while pc < len(bytecode):
-            op = bytecode[pc]
-            if op == '60':  # PUSH1 opcode
-                pc += 1
-                value = int(bytecode[pc], 16)
-                self.push(value)
-                pc += 1  # Skip the value part
-            elif op in ['01', '02', '03']:  # Arithmetic operations
-                getattr(self, { '01': 'add', '02': 'sub', '03': 'mul'}[op])()
-                pc += 1
-            elif op == '52':  # MSTORE opcode
-                value = self.pop()
-                address = self.pop()
-                self.mstore(address, value)
-                pc += 1
-            elif op == '51':  # MLOAD opcode
-                address = self.pop()
-                self.mload(address)
-                pc += 1
+        code = bytes.fromhex(''.join(bytecode))
+        handlers, unchecked, imms, low, high = EVM._decode(code)
+        sp = self.sp
+        if sp + low >= 0 and sp + high <= len(self.stack):
+            run_counts = EVM._run_counts
+            runs = run_counts.get(code, 0)
+            if runs >= _COMPILE_THRESHOLD:
+                EVM._compile(code)(self)
+                return
+            if len(run_counts) >= _CACHE_SIZE:  # Keep the counters bounded like the caches
+                run_counts.clear()
+            run_counts[code] = runs + 1
+            handlers = unchecked
+        for handler, arg in zip(handlers, imms):
+            if arg is None:
+                handler(self)
             else:
-                print(f"Unknown opcode: {op}")
-                break
+                handler(self, arg)
+
+    def execute_jit(self, bytecode):
+        """
+        Executes bytecode through the Numba-compiled loop in ``py_evm_jit``.
+
+        Requires NumPy. Values are held as int64 while the loop runs, so
+        results that overflow 64 bits wrap instead of growing like Python ints.
+        Live stack values or PUSH immediates that do not fit in int64 and
+        negative memory addresses raise an exception; the latter because the
+        compiled loop does not bounds-check array accesses.
+
+        :param bytecode: The bytecode instructions to execute.
+        """
+        import py_evm_jit
+
+        code = np.frombuffer(bytes.fromhex(''.join(bytecode)), np.uint8)
+        live = self.stack[:self.sp]
+        if not all(_WORD_MIN <= value <= _WORD_MAX for value in live):
+            raise Exception("Value out of 64-bit range")
+        stack = np.zeros(len(self.stack), np.int64)
+        stack[:self.sp] = live
+
+        status, pc, sp = py_evm_jit.run(code, 0, stack, self.sp, self.memory)
+        while status == py_evm_jit.MEMORY_FULL:
+            self._grow_memory(int(stack[sp - 2]))
+            status, pc, sp = py_evm_jit.run(code, pc, stack, sp, self.memory)
+
+        self.sp = int(sp)
+        self.stack[:self.sp] = stack[:self.sp].tolist()
+        if status == py_evm_jit.UNKNOWN_OPCODE:
+            print(f"Unknown opcode: {code[pc]:02x}")
+        elif status == py_evm_jit.STACK_UNDERFLOW:
+            raise Exception("Stack underflow")
+        elif status == py_evm_jit.STACK_OVERFLOW:
+            raise Exception("Stack overflow")
+        elif status == py_evm_jit.INVALID_ADDRESS:
+            raise Exception("Invalid memory address")
+        elif status == py_evm_jit.VALUE_OUT_OF_RANGE:
+            raise Exception("Value out of 64-bit range")
 
     def close(self):
-        """Closes the database connection."""
-        self.conn.close()
+        """
+        Releases this instance's database cursors.
+
+        Pooled connections stay open for later instances using the same path;
+        an unpooled in-memory connection is closed.
+        """
+        self.cursor.close()
+        self._store_cursor.close()
+        self._load_cursor.close()
+        if _POOL.get(self._db_path) is not self._db:
+            self.conn.close()
+
+EVM._build_dispatch()
+EVM._check_source()
 
 # Initialize the EVM instance and demonstrate memory and persistent storage operations.
 evm = EVM()
@@ -1,11 +1,11 @@
-import asyncio
-import re
-from eth.db.atomic import AtomicDB
-from eth.chains.mainnet import MainnetChain
-from eth.vm.forks.byzantium import ByzantiumVM
-from eth_utils import to_wei
-from eth_keys import keys
-from eth_utils import decode_hex, add_0x_prefix , exceptions
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from eth_utils import decode_hex
+
+if TYPE_CHECKING:
+    from eth.chains.mainnet import MainnetChain
 
 
 def initialize_chain() -> MainnetChain:
@@ -15,6 +15,13 @@ def initialize_chain() -> MainnetChain:
     Returns:
         A Byzantium-configured MainnetChain instance with a custom genesis block.
     """
+    # py-evm is imported here so that using sanitize_hex_data alone stays cheap
+    from eth.chains.mainnet import MainnetChain
+    from eth.db.atomic import AtomicDB
+    from eth.vm.forks.byzantium import ByzantiumVM
+    from eth_keys import keys
+    from eth_utils import to_wei
+
     db = AtomicDB()
     custom_chain = MainnetChain.configure(
         '__CustomChain', 
@@ -73,6 +80,7 @@ def sanitize_hex_data(data_hex: str) -> str:
 
     Returns:
         A cleaned hexadecimal string with an even number of digits and '0x' prefix.
+        Input that is already clean is returned unchanged.
 
     Raises:
         ValueError: If the input string contains non-hexadecimal characters.
@@ -81,15 +89,21 @@ def sanitize_hex_data(data_hex: str) -> str:
         raise ValueError("Hex data must start with '0x' prefix.")
     
     cleaned_data_hex = data_hex[2:]  # Remove '0x' prefix
-    if re.match(r'^[0-9a-fA-F]+$', cleaned_data_hex) is None:
-        raise ValueError("Hex string contains non-hexadecimal characters.")
-    
-    if len(cleaned_data_hex) % 2 != 0:
+    padded = len(cleaned_data_hex) % 2 != 0
+    if padded:
         cleaned_data_hex = '0' + cleaned_data_hex
-    
-    return add_0x_prefix(cleaned_data_hex)
 
-async def apply_transaction(chain: MainnetChain, signed_transaction):
+    try:
+        decoded_len = len(bytes.fromhex(cleaned_data_hex))
+    except ValueError:
+        decoded_len = 0
+    # bytes.fromhex skips whitespace, so a short result also means invalid input
+    if not decoded_len or decoded_len * 2 != len(cleaned_data_hex):
+        raise ValueError("Hex string contains non-hexadecimal characters.")
+
+    return '0x' + cleaned_data_hex if padded else data_hex
+
+def apply_transaction(chain: MainnetChain, signed_transaction):
     """
     Applies a signed transaction to the EVM chain and logs the outcome.
 
@@ -113,43 +127,48 @@ async def apply_transaction(chain: MainnetChain, signed_transaction):
         print("Logs:", computation.get_log_entries())
         print("Estimated gas:", receipt.gas_used)
 
-async def main():
+def main():
     """
     Main function to initialize the chain, prepare and sign a transaction, then apply it.
     """
+    from eth_keys import keys
+    from eth_utils import exceptions
+
     chain = initialize_chain()
     private_key = keys.PrivateKey(b'\x01' * 32)  # Example key, replace with secure key management
     
     account = private_key.public_key.to_canonical_address()
+    vm = chain.get_vm()
+    header = vm.get_header()
     
     print("Account address:", account.hex())
-    print("Account balance:", chain.get_vm().state._account_db.get_balance(account))
-    print("Chain head:", chain.get_vm().get_header().hash.hex())
-    print("Chain difficulty:", chain.get_vm().get_header().difficulty)
-    print("Chain gas limit:", chain.get_vm().get_header().gas_limit)
-    print("Chain timestamp:", chain.get_vm().get_header().timestamp)
-    print("Chain coinbase:", chain.get_vm().get_header().coinbase.hex())
-    print("Chain state root:", chain.get_vm().get_header().state_root.hex())
-    print("Chain transaction root:", chain.get_vm().get_header().transaction_root.hex())
-    print("Chain receipt root:", chain.get_vm().get_header().receipt_root.hex())
-    print("Chain bloom:", chain.get_vm().get_header().bloom)
-    print("Chain gas used:", chain.get_vm().get_header().gas_used)
-    print("Chain extra data:", chain.get_vm().get_header().extra_data.hex())
-    print("Chain mix hash:", chain.get_vm().get_header().mix_hash.hex())
-    print("Chain nonce:", chain.get_vm().get_header().nonce.hex())
+    print("Account balance:", vm.state._account_db.get_balance(account))
+    print("Chain head:", header.hash.hex())
+    print("Chain difficulty:", header.difficulty)
+    print("Chain gas limit:", header.gas_limit)
+    print("Chain timestamp:", header.timestamp)
+    print("Chain coinbase:", header.coinbase.hex())
+    print("Chain state root:", header.state_root.hex())
+    print("Chain transaction root:", header.transaction_root.hex())
+    print("Chain receipt root:", header.receipt_root.hex())
+    print("Chain bloom:", header.bloom)
+    print("Chain gas used:", header.gas_used)
+    print("Chain extra data:", header.extra_data.hex())
+    print("Chain mix hash:", header.mix_hash.hex())
+    print("Chain nonce:", header.nonce.hex())
     
     try:
         # Contract bytecode or function call data in hex format 
         data_hex = '0x600160005401600055'
         signed_tx = prepare_transaction(chain, private_key, data_hex)
-        print("Account balance after transaction:", chain.get_vm().state._account_db.get_balance(account))
+        print("Account balance after transaction:", vm.state._account_db.get_balance(account))
 
-        await apply_transaction(chain, signed_tx)
+        apply_transaction(chain, signed_tx)
         
     except exceptions.ValidationError as e:
         print("Transaction validation failed:", e)
         print("Transaction data:", data_hex)
-        print("Transaction signer:", private_key.public_key.to_canonical_address().hex())
+        print("Transaction signer:", account.hex())
         print("Transaction nonce:", signed_tx.nonce)
         print("Transaction gas price:", signed_tx.gas_price)
         print("Transaction gas limit:", signed_tx.gas)
@@ -160,4 +179,4 @@ async def main():
         print("You can't execute this transaction. Please check the logs for more information.")
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    main()
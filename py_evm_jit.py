@@ -0,0 +1,94 @@
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; run() then executes as plain Python
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+# Exit statuses returned by run()
+OK = 0
+UNKNOWN_OPCODE = 1
+STACK_UNDERFLOW = 2
+STACK_OVERFLOW = 3
+MEMORY_FULL = 4
+INVALID_ADDRESS = 5
+VALUE_OUT_OF_RANGE = 6
+
+
+@njit(cache=True)
+def run(code, pc, stack, sp, mem):
+    """
+    Runs pre-encoded bytecode over a fixed-size stack and memory.
+
+    The stack and its cursor are passed in and handed back out so the caller
+    can inspect the state afterwards. Execution stops early with a non-OK
+    status; on MEMORY_FULL the caller grows ``mem`` and resumes from ``pc``.
+
+    Args:
+        code: The bytecode as a uint8 array.
+        pc: The program counter to start from.
+        stack: An int64 array of 1024 slots holding the stack.
+        sp: The current stack depth.
+        mem: An int64 array holding memory.
+
+    Returns:
+        A ``(status, pc, sp)`` tuple.
+    """
+    n = code.shape[0]
+    while pc < n:
+        op = code[pc]
+        if 0x60 <= op <= 0x7f:  # PUSH1..PUSH32
+            if sp == stack.shape[0]:
+                return STACK_OVERFLOW, pc, sp
+            size = op - 0x5f
+            value = 0
+            for i in range(pc + 1, pc + 1 + size):
+                if value >= 1 << 55:  # Another byte would not fit in int64
+                    return VALUE_OUT_OF_RANGE, pc, sp
+                value = (value << 8) | (int(code[i]) if i < n else 0)
+            stack[sp] = value
+            sp += 1
+            pc += 1 + size
+        elif op == 0x01:  # ADD
+            if sp < 2:
+                return STACK_UNDERFLOW, pc, sp
+            stack[sp - 2] = stack[sp - 2] + stack[sp - 1]
+            sp -= 1
+            pc += 1
+        elif op == 0x02:  # SUB
+            if sp < 2:
+                return STACK_UNDERFLOW, pc, sp
+            stack[sp - 2] = stack[sp - 2] - stack[sp - 1]
+            sp -= 1
+            pc += 1
+        elif op == 0x03:  # MUL
+            if sp < 2:
+                return STACK_UNDERFLOW, pc, sp
+            stack[sp - 2] = stack[sp - 2] * stack[sp - 1]
+            sp -= 1
+            pc += 1
+        elif op == 0x52:  # MSTORE
+            if sp < 2:
+                return STACK_UNDERFLOW, pc, sp
+            address = stack[sp - 2]
+            if address < 0:
+                return INVALID_ADDRESS, pc, sp
+            if address >= mem.shape[0]:
+                return MEMORY_FULL, pc, sp
+            mem[address] = stack[sp - 1]
+            sp -= 2
+            pc += 1
+        elif op == 0x51:  # MLOAD
+            if sp < 1:
+                return STACK_UNDERFLOW, pc, sp
+            address = stack[sp - 1]
+            if address < 0:
+                return INVALID_ADDRESS, pc, sp
+            stack[sp - 1] = mem[address] if address < mem.shape[0] else 0
+            pc += 1
+        else:
+            return UNKNOWN_OPCODE, pc, sp
+    return OK, pc, sp